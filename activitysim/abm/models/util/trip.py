@@ -62,7 +62,8 @@ def cleanup_failed_trips(trips):
         trips = trips[~trips.failed]
 
         # increasing trip_id order
-        patch_trips = trips[trips.patch].sort_index()
+        # (only the grouping columns are needed, so avoid copying every column of the patch rows)
+        patch_trips = trips.loc[trips.patch, ['tour_id', 'outbound']].sort_index()
 
         # recompute fields dependent on trip_num sequence
         grouped = patch_trips.groupby(['tour_id', 'outbound'])
@@ -3,19 +3,20 @@ import sys
 import requests
 import shutil
 import glob
-import pkg_resources
 import yaml
 
 PACKAGE = 'activitysim'
 EXAMPLES_DIR = 'examples'
 MANIFEST = 'example_manifest.yaml'
 
+# resolve the examples dir once from the package location rather than via pkg_resources,
+# which is slow to import and rescans installed distributions on every lookup
+_EXAMPLES_ROOT = \
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), EXAMPLES_DIR)
 
-def _example_path(resource):
-    resource = os.path.join(EXAMPLES_DIR, resource)
-    path = pkg_resources.resource_filename(PACKAGE, resource)
 
-    return path
+def _example_path(resource):
+    return os.path.join(_EXAMPLES_ROOT, resource)
 
 
 def _load_manifest():
@@ -5,11 +5,8 @@ import os
 import logging
 import argparse
 
-from activitysim.core import inject
-from activitysim.core import tracing
-from activitysim.core import config
-from activitysim.core import pipeline
-from activitysim.core import chunk
+# activitysim.core imports are deferred to the functions that need them so that
+# add_run_args (e.g. for 'activitysim run --help') does not pull in numpy/pandas
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +53,9 @@ def add_run_args(parser, multiprocess=True):
 
 
 def validate_injectable(name):
+
+    from activitysim.core import inject
+
     try:
         dir_paths = inject.get_injectable(name)
     except RuntimeError:
@@ -79,6 +79,9 @@ def validate_injectable(name):
 
 def handle_standard_args(args, multiprocess=True):
 
+    from activitysim.core import config
+    from activitysim.core import inject
+
     def inject_arg(name, value):
         assert name in INJECTABLES
         inject.add_injectable(name, value)
@@ -121,20 +124,20 @@ def handle_standard_args(args, multiprocess=True):
 
 def cleanup_output_files():
 
+    from activitysim.core import tracing
+
     active_log_files = \
         [h.baseFilename for h in logger.root.handlers if isinstance(h, logging.FileHandler)]
-    tracing.delete_output_files('log', ignore=active_log_files)
 
-    tracing.delete_output_files('h5')
-    tracing.delete_output_files('csv')
-    tracing.delete_output_files('txt')
-    tracing.delete_output_files('yaml')
-    tracing.delete_output_files('prof')
-    tracing.delete_output_files('omx')
+    # scan output dirs once for all file types rather than once per type
+    tracing.delete_output_files_multi(['log', 'h5', 'csv', 'txt', 'yaml', 'prof', 'omx'],
+                                      ignore=active_log_files)
 
 
 def log_settings():
 
+    from activitysim.core import config
+
     settings = [
         'households_sample_size',
         'chunk_size',
@@ -156,6 +159,10 @@ def run(args):
 
     """
 
+    from activitysim.core import config
+    from activitysim.core import inject
+    from activitysim.core import tracing
+
     from activitysim import abm  # register injectables
 
     tracing.config_logger(basic=True)
@@ -187,6 +194,9 @@ def run(args):
     else:
         logger.info('run single process simulation')
 
+        from activitysim.core import chunk
+        from activitysim.core import pipeline
+
         pipeline.run(models=config.setting('models'), resume_after=resume_after)
         pipeline.close_pipeline()
         chunk.log_write_hwm()
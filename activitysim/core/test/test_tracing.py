@@ -12,12 +12,22 @@ from .. import inject
 
 def close_handlers():
 
-    loggers = logging.Logger.manager.loggerDict
-    for name in loggers:
-        logger = logging.getLogger(name)
-        logger.handlers = []
-        logger.propagate = True
-        logger.setLevel(logging.NOTSET)
+    # placeholders have no state to reset, and calling getLogger on them would create loggers
+    loggers = [logger for logger in logging.Logger.manager.loggerDict.values()
+               if isinstance(logger, logging.Logger)]
+    for logger in loggers:
+        if logger.handlers or not logger.propagate or logger.level != logging.NOTSET:
+            logger.handlers = []
+            logger.propagate = True
+            logger.setLevel(logging.NOTSET)
+
+
+@pytest.fixture(autouse=True)
+def reset_loggers():
+
+    yield
+
+    close_handlers()
 
 
 def add_canonical_dirs():
@@ -85,8 +95,6 @@ def test_print_summary(capsys):
 
     assert 'print_summary neither value_counts nor describe' in out
 
-    close_handlers()
-
 
 def test_register_households(capsys):
 
@@ -113,8 +121,6 @@ def test_register_households(capsys):
     # should warn that household id not in index
     assert 'trace_hh_id 5 not in dataframe' in out
 
-    close_handlers()
-
 
 def test_register_tours(capsys):
 
@@ -159,8 +165,6 @@ def test_register_tours(capsys):
     traceable_table_ids = inject.get_injectable('traceable_table_ids')
     assert traceable_table_ids['tours'] == [12]
 
-    close_handlers()
-
 
 def test_write_csv(capsys):
 
@@ -177,8 +181,6 @@ def test_write_csv(capsys):
 
     assert "unexpected type" in out
 
-    close_handlers()
-
 
 def test_slice_ids():
 
@@ -232,5 +234,3 @@ def test_basic(capsys):
     assert 'log_warn' in out
     assert 'log_info' in out
     assert 'log_debug' not in out
-
-    close_handlers()
@@ -58,8 +58,31 @@ def delete_output_files(file_type, ignore=None, subdir=None):
 
     Parameters
     ----------
-    output_dir: str
-        Directory of trace output CSVs
+    file_type: str
+        file extension (suffix) of files to delete
+    ignore: list of str
+        paths of files not to delete (e.g. active log files)
+
+    Returns
+    -------
+    Nothing
+    """
+
+    delete_output_files_multi([file_type], ignore=ignore)
+
+
+def delete_output_files_multi(file_types, ignore=None):
+    """
+    Delete files in output directory of any of the specified types
+
+    Each output subdirectory is scanned only once, regardless of the number of file types.
+
+    Parameters
+    ----------
+    file_types: iterable of str
+        file extensions (suffixes) of files to delete
+    ignore: list of str
+        paths of files not to delete (e.g. active log files)
 
     Returns
     -------
@@ -68,6 +91,9 @@ def delete_output_files(file_type, ignore=None, subdir=None):
 
     output_dir = inject.get_injectable('output_dir')
 
+    file_types = tuple(file_types)
+    ignore = set(os.path.realpath(p) for p in ignore) if ignore else None
+
     directories = ['', 'log', 'trace']
 
     for subdir in directories:
@@ -77,22 +103,20 @@ def delete_output_files(file_type, ignore=None, subdir=None):
         if not os.path.exists(dir):
             continue
 
-        if ignore:
-            ignore = [os.path.realpath(p) for p in ignore]
+        # logger.debug("Deleting %s files in output dir %s" % (file_types, dir))
 
-        # logger.debug("Deleting %s files in output dir %s" % (file_type, dir))
-
-        for the_file in os.listdir(dir):
-            if the_file.endswith(file_type):
-                file_path = os.path.join(dir, the_file)
+        with os.scandir(dir) as it:
+            for entry in it:
+                if not entry.name.endswith(file_types):
+                    continue
 
-                if ignore and os.path.realpath(file_path) in ignore:
-                    logger.debug("delete_output_files ignoring %s" % file_path)
+                if ignore and os.path.realpath(entry.path) in ignore:
+                    logger.debug("delete_output_files ignoring %s" % entry.path)
                     continue
 
                 try:
-                    if os.path.isfile(file_path):
-                        os.unlink(file_path)
+                    if entry.is_file():
+                        os.unlink(entry.path)
                 except Exception as e:
                     print(e)
 